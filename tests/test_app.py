@@ -7,82 +7,106 @@ from fastapi.testclient import TestClient
 from src.app import app, activities
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client"""
-    return TestClient(app)
+    """Create a test client shared across the whole test session"""
+    with TestClient(app) as test_client:
+        yield test_client
 
 
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    # Store original state
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Practice basketball skills and compete in inter-school games",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
-            "max_participants": 15,
-            "participants": ["james@mergington.edu", "liam@mergington.edu"]
-        },
-        "Swimming Club": {
-            "description": "Improve swimming techniques and train for competitions",
-            "schedule": "Mondays and Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 25,
-            "participants": ["ava@mergington.edu", "noah@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Explore theater arts and perform in school plays",
-            "schedule": "Thursdays, 3:30 PM - 5:30 PM",
-            "max_participants": 20,
-            "participants": ["isabella@mergington.edu", "mia@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Create visual art with various mediums including painting and sculpture",
-            "schedule": "Wednesdays, 3:00 PM - 5:00 PM",
-            "max_participants": 15,
-            "participants": ["ethan@mergington.edu", "charlotte@mergington.edu"]
-        },
-        "Science Olympiad": {
-            "description": "Prepare for science competitions and conduct experiments",
-            "schedule": "Fridays, 3:00 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["william@mergington.edu", "amelia@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Develop critical thinking and public speaking through debates",
-            "schedule": "Tuesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 16,
-            "participants": ["benjamin@mergington.edu", "harper@mergington.edu"]
-        }
+# Pristine copy of the in-memory database
+_PRISTINE_ACTIVITIES = {
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+    },
+    "Basketball Team": {
+        "description": "Practice basketball skills and compete in inter-school games",
+        "schedule": "Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
+        "max_participants": 15,
+        "participants": ["james@mergington.edu", "liam@mergington.edu"]
+    },
+    "Swimming Club": {
+        "description": "Improve swimming techniques and train for competitions",
+        "schedule": "Mondays and Wednesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 25,
+        "participants": ["ava@mergington.edu", "noah@mergington.edu"]
+    },
+    "Drama Club": {
+        "description": "Explore theater arts and perform in school plays",
+        "schedule": "Thursdays, 3:30 PM - 5:30 PM",
+        "max_participants": 20,
+        "participants": ["isabella@mergington.edu", "mia@mergington.edu"]
+    },
+    "Art Studio": {
+        "description": "Create visual art with various mediums including painting and sculpture",
+        "schedule": "Wednesdays, 3:00 PM - 5:00 PM",
+        "max_participants": 15,
+        "participants": ["ethan@mergington.edu", "charlotte@mergington.edu"]
+    },
+    "Science Olympiad": {
+        "description": "Prepare for science competitions and conduct experiments",
+        "schedule": "Fridays, 3:00 PM - 5:00 PM",
+        "max_participants": 18,
+        "participants": ["william@mergington.edu", "amelia@mergington.edu"]
+    },
+    "Debate Team": {
+        "description": "Develop critical thinking and public speaking through debates",
+        "schedule": "Tuesdays, 4:00 PM - 5:30 PM",
+        "max_participants": 16,
+        "participants": ["benjamin@mergington.edu", "harper@mergington.edu"]
     }
-    
-    # Reset to original state
-    activities.clear()
-    activities.update(original_activities)
-    
+}
+
+_PRISTINE_PARTICIPANT_SETS = {
+    name: set(details["participants"])
+    for name, details in _PRISTINE_ACTIVITIES.items()
+}
+
+
+@pytest.fixture
+def reset_activities():
+    """Restore participant lists after a mutating test"""
+    saved = {name: list(details["participants"]) for name, details in activities.items()}
     yield
-    
-    # Cleanup after test
-    activities.clear()
-    activities.update(original_activities)
+    for name, participants in saved.items():
+        activities[name]["participants"] = participants
+
+
+_CHESS_SIGNUP = "/activities/Chess Club/signup"
+_CHESS_UNREGISTER = "/activities/Chess Club/unregister"
+
+# Query params reused across requests, keyed by email
+_PARAMS_CACHE = {
+    email: {"email": email}
+    for email in (
+        "test@mergington.edu",
+        "newstudent@mergington.edu",
+        "michael@mergington.edu",
+        "multitasker@mergington.edu",
+        "notregistered@mergington.edu",
+        "workflow@mergington.edu",
+    )
+}
+
+
+def participants_of(name):
+    """Return the live participant list for an activity"""
+    return activities[name]["participants"]
 
 
 class TestRootEndpoint:
@@ -120,9 +144,10 @@ class TestGetActivities:
         assert "max_participants" in chess_club
         assert "participants" in chess_club
         assert chess_club["max_participants"] == 12
-        assert "michael@mergington.edu" in chess_club["participants"]
+        assert set(chess_club["participants"]) == _PRISTINE_PARTICIPANT_SETS["Chess Club"]
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestSignupForActivity:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
     
@@ -130,33 +155,22 @@ class TestSignupForActivity:
         """Test successful signup of a new student"""
         email = "newstudent@mergington.edu"
         response = client.post(
-            "/activities/Chess Club/signup",
-            params={"email": email}
+            _CHESS_SIGNUP,
+            params=_PARAMS_CACHE[email]
         )
         assert response.status_code == 200
         data = response.json()
         assert data["message"] == f"Signed up {email} for Chess Club"
         
         # Verify student was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data["Chess Club"]["participants"]
-    
-    def test_signup_activity_not_found(self, client):
-        """Test signup to non-existent activity"""
-        response = client.post(
-            "/activities/Nonexistent Club/signup",
-            params={"email": "test@mergington.edu"}
-        )
-        assert response.status_code == 404
-        assert response.json()["detail"] == "Activity not found"
+        assert email in participants_of("Chess Club")
     
     def test_signup_already_registered(self, client):
         """Test signup when student is already registered"""
         email = "michael@mergington.edu"  # Already in Chess Club
         response = client.post(
-            "/activities/Chess Club/signup",
-            params={"email": email}
+            _CHESS_SIGNUP,
+            params=_PARAMS_CACHE[email]
         )
         assert response.status_code == 400
         assert response.json()["detail"] == "Student already signed up for this activity"
@@ -167,25 +181,24 @@ class TestSignupForActivity:
         
         # Sign up for Chess Club
         response1 = client.post(
-            "/activities/Chess Club/signup",
-            params={"email": email}
+            _CHESS_SIGNUP,
+            params=_PARAMS_CACHE[email]
         )
         assert response1.status_code == 200
         
         # Sign up for Programming Class
         response2 = client.post(
             "/activities/Programming Class/signup",
-            params={"email": email}
+            params=_PARAMS_CACHE[email]
         )
         assert response2.status_code == 200
         
         # Verify both signups
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data["Chess Club"]["participants"]
-        assert email in activities_data["Programming Class"]["participants"]
+        assert email in participants_of("Chess Club")
+        assert email in participants_of("Programming Class")
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestUnregisterFromActivity:
     """Tests for DELETE /activities/{activity_name}/unregister endpoint"""
     
@@ -193,33 +206,22 @@ class TestUnregisterFromActivity:
         """Test successful unregistration"""
         email = "michael@mergington.edu"  # Already in Chess Club
         response = client.delete(
-            "/activities/Chess Club/unregister",
-            params={"email": email}
+            _CHESS_UNREGISTER,
+            params=_PARAMS_CACHE[email]
         )
         assert response.status_code == 200
         data = response.json()
         assert data["message"] == f"Unregistered {email} from Chess Club"
         
         # Verify student was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data["Chess Club"]["participants"]
-    
-    def test_unregister_activity_not_found(self, client):
-        """Test unregister from non-existent activity"""
-        response = client.delete(
-            "/activities/Nonexistent Club/unregister",
-            params={"email": "test@mergington.edu"}
-        )
-        assert response.status_code == 404
-        assert response.json()["detail"] == "Activity not found"
+        assert email not in participants_of("Chess Club")
     
     def test_unregister_not_registered(self, client):
         """Test unregister when student is not registered"""
         email = "notregistered@mergington.edu"
         response = client.delete(
-            "/activities/Chess Club/unregister",
-            params={"email": email}
+            _CHESS_UNREGISTER,
+            params=_PARAMS_CACHE[email]
         )
         assert response.status_code == 400
         assert response.json()["detail"] == "Student is not registered for this activity"
@@ -230,24 +232,40 @@ class TestUnregisterFromActivity:
         
         # Unregister
         unregister_response = client.delete(
-            "/activities/Chess Club/unregister",
-            params={"email": email}
+            _CHESS_UNREGISTER,
+            params=_PARAMS_CACHE[email]
         )
         assert unregister_response.status_code == 200
         
         # Re-sign up
         signup_response = client.post(
-            "/activities/Chess Club/signup",
-            params={"email": email}
+            _CHESS_SIGNUP,
+            params=_PARAMS_CACHE[email]
         )
         assert signup_response.status_code == 200
         
         # Verify student is back
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data["Chess Club"]["participants"]
+        assert email in participants_of("Chess Club")
+
+
+class TestActivityNotFound:
+    """Tests for requests targeting a non-existent activity"""
+    
+    @pytest.mark.parametrize("method,path", [
+        ("post", "/activities/Nonexistent Club/signup"),
+        ("delete", "/activities/Nonexistent Club/unregister"),
+    ])
+    def test_activity_not_found(self, client, method, path):
+        """Test signup and unregister against a non-existent activity"""
+        response = getattr(client, method)(
+            path,
+            params=_PARAMS_CACHE["test@mergington.edu"]
+        )
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Activity not found"
 
 
+@pytest.mark.usefixtures("reset_activities")
 class TestActivityWorkflow:
     """Integration tests for complete activity workflows"""
     
@@ -257,32 +275,26 @@ class TestActivityWorkflow:
         activity = "Drama Club"
         
         # Get initial state
-        initial_response = client.get("/activities")
-        initial_data = initial_response.json()
-        initial_count = len(initial_data[activity]["participants"])
+        initial_count = len(participants_of(activity))
         
         # Sign up
         signup_response = client.post(
             f"/activities/{activity}/signup",
-            params={"email": email}
+            params=_PARAMS_CACHE[email]
         )
         assert signup_response.status_code == 200
         
         # Verify added
-        after_signup = client.get("/activities")
-        after_signup_data = after_signup.json()
-        assert len(after_signup_data[activity]["participants"]) == initial_count + 1
-        assert email in after_signup_data[activity]["participants"]
+        assert len(participants_of(activity)) == initial_count + 1
+        assert email in participants_of(activity)
         
         # Unregister
         unregister_response = client.delete(
             f"/activities/{activity}/unregister",
-            params={"email": email}
+            params=_PARAMS_CACHE[email]
         )
         assert unregister_response.status_code == 200
         
         # Verify removed
-        after_unregister = client.get("/activities")
-        after_unregister_data = after_unregister.json()
-        assert len(after_unregister_data[activity]["participants"]) == initial_count
-        assert email not in after_unregister_data[activity]["participants"]
+        assert len(participants_of(activity)) == initial_count
+        assert email not in participants_of(activity)